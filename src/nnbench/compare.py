@@ -1,7 +1,7 @@
 """Contains machinery to compare multiple benchmark records side by side."""
 
-import copy
 from collections.abc import Sequence
+from typing import Any
 
 from rich.console import Console
 from rich.table import Table
@@ -37,11 +37,13 @@ def get_value_by_name(record: BenchmarkRecord, name: str, missing: str) -> str:
         as rich text.
 
     """
-    metric_names = [b["name"] for b in record.benchmarks]
-    if name not in metric_names:
-        return missing
+    for res in record.benchmarks:
+        if res["name"] == name:
+            return _format_value(res, missing)
+    return missing
 
-    res = record.benchmarks[metric_names.index(name)]
+
+def _format_value(res: dict[str, Any], missing: str) -> str:
     if res.get("error_occurred", False):
         errmsg = res.get("error_message", "<unknown>")
         return "[red]ERROR: [/red]" + errmsg
@@ -76,13 +78,15 @@ def compare(
     columns: list[str] = ["Benchmark run"]
 
     # Add metric names first, without duplicates.
+    seen = set(columns)
     for record in records:
-        names = [b["name"] for b in record.benchmarks]
-        for name in names:
-            if name not in set(columns):
+        for b in record.benchmarks:
+            name = b["name"]
+            if name not in seen:
+                seen.add(name)
                 columns.append(name)
 
-    names = copy.deepcopy(columns[1:])
+    names = columns[1:]
 
     # Then parameters, if any
     if parameters is not None:
@@ -96,8 +100,15 @@ def compare(
     for record in records:
         # flatten facilitates dotted access to nested context values, e.g. git.branch
         ctx = flatten(record.context)
+        # index the results by name once, instead of searching them for every metric.
+        results: dict[str, dict[str, Any]] = {}
+        for res in record.benchmarks:
+            results.setdefault(res["name"], res)
         row = [record.run]
-        row += [get_value_by_name(record, name, _MISSING) for name in names]
+        row += [
+            _format_value(results[name], _MISSING) if name in results else _MISSING
+            for name in names
+        ]
         # hacky, extra cols is likely now broken
         b = record.benchmarks[0]
         # TODO: Add record-level parameters struct as the union of all benchmark inputs
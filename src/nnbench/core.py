@@ -13,8 +13,11 @@ from nnbench.types.benchmark import NoOp
 from nnbench.types.memo import is_memo, is_memo_type
 
 
-def _check_against_interface(params: dict[str, Any], fun: Callable) -> None:
-    sig = inspect.signature(fun)
+def _check_against_interface(
+    params: dict[str, Any], fun: Callable, sig: inspect.Signature | None = None
+) -> None:
+    # allow passing a precomputed signature, e.g. for checking a whole benchmark family.
+    sig = sig or inspect.signature(fun)
     fvarnames = set(sig.parameters.keys())
     fvartypes = {k: v.annotation for k, v in sig.parameters.items()}
     varnames = set(params.keys())
@@ -160,11 +163,16 @@ def parametrize(
         A parametrized decorator returning the benchmark family.
     """
 
+    # materialize the parameters, so that the decorator also works for one-shot iterators.
+    parameters = tuple(parameters)
+
     def decorator(fn: Callable) -> list[Benchmark]:
         benchmarks = []
         names = set()
+        # the signature is the same for the whole family, so inspect it only once.
+        sig = inspect.signature(fn)
         for params in parameters:
-            _check_against_interface(params, fn)
+            _check_against_interface(params, fn, sig)
 
             name = namegen(fn, **params)
             if name in names:
@@ -227,9 +235,10 @@ def product(
         benchmarks = []
         names = set()
         varnames = iterables.keys()
+        sig = inspect.signature(fn)
         for values in itertools.product(*iterables.values()):
             params = dict(zip(varnames, values))
-            _check_against_interface(params, fn)
+            _check_against_interface(params, fn, sig)
 
             name = namegen(fn, **params)
             if name in names:
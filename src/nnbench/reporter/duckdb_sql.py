@@ -4,6 +4,12 @@ import sys
 import tempfile
 import weakref
 from pathlib import Path
+from typing import Any
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
 
 try:
     import duckdb
@@ -61,21 +67,44 @@ class DuckDBReporter(FileReporter):
         self.read_only = read_only
 
         # A place to store intermediate JSON records.
-        if not directory:
-            self._directory = Path(tempfile.mkdtemp())
-            self.delete = True
-        else:
-            self._directory = Path(directory)
-            self.delete = delete
-
-        weakref.finalize(self, self.finalize)
+        self._user_directory = Path(directory) if directory else None
+        self._directory: Path | None = None
+        self._cleanup: weakref.finalize | None = None
+        # a temporary directory is always deleted after use.
+        self.delete = delete or self._user_directory is None
+        if self._user_directory is not None:
+            self._directory = self._user_directory
+            self._register_cleanup()
 
         self.conn: duckdb.DuckDBPyConnection | None = None
 
+    def __enter__(self) -> Self:
+        self.initialize()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.finalize()
+
     @property
     def directory(self) -> os.PathLike[str]:
+        if self._directory is None:
+            # the directory is created on first use, and again after a previous finalize().
+            if self._user_directory is None:
+                self._directory = Path(tempfile.mkdtemp())
+            else:
+                self._directory = self._user_directory
+                self._directory.mkdir(parents=True, exist_ok=True)
+            self._register_cleanup()
         return self._directory
 
+    def _register_cleanup(self) -> None:
+        if self.delete:
+            # NB: The finalizer must not reference the reporter itself,
+            # otherwise the reporter is kept alive until interpreter shutdown.
+            self._cleanup = weakref.finalize(
+                self, shutil.rmtree, self._directory, ignore_errors=True
+            )
+
     def initialize(self):
         self.conn = duckdb.connect(self.dbname, read_only=self.read_only)
         self._initialized = True
@@ -83,9 +112,14 @@ class DuckDBReporter(FileReporter):
     def finalize(self):
         if self.conn:
             self.conn.close()
-
-        if self.delete:
-            shutil.rmtree(self._directory, ignore_errors=True)
+            self.conn = None
+        self._initialized = False
+
+        if self._cleanup is not None:
+            # runs the directory removal at most once, and unregisters it from GC.
+            self._cleanup()
+            self._cleanup = None
+            self._directory = None
 
     def read_sql(
         self,
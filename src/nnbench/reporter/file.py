@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 import threading
@@ -5,6 +6,13 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import IO, Any
 
+try:
+    import orjson
+
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
+
 from nnbench.reporter.base import BenchmarkReporter
 from nnbench.types import BenchmarkRecord
 
@@ -18,6 +26,54 @@ SerDe = tuple[
 _file_drivers: dict[str, SerDe] = {}
 _file_driver_lock = threading.Lock()
 
+# matches the first protocol separator in a URL, e.g. "s3://" or a chained "simplecache::".
+_PROTOCOL_SEP = re.compile(r"::|://")
+
+
+# orjson only decodes integers within the 64-bit range exactly, and silently turns larger
+# ones into floats. Those have at least 19 digits, so documents containing such digit runs
+# are decoded with the standard library instead (this also catches some harmless cases,
+# e.g. long fractional parts, which are then just decoded more slowly).
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+
+def _json_decoder(options: dict[str, Any]) -> Callable[[str], Any]:
+    """
+    Returns a function deserializing a single JSON document, decoding with ``orjson``
+    if it is installed and no options for ``json.loads()`` were given.
+
+    The decoder is chosen once per file rather than once per document (e.g. per
+    NDJSON line), since the choice is the same for every document in it.
+    """
+    import json
+
+    if options or not ORJSON_INSTALLED:
+        return functools.partial(json.loads, **options)
+
+    def loads(s: str) -> Any:
+        if _LONG_DIGITS.search(s):
+            return json.loads(s)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the standard library (e.g. it rejects NaN),
+            # so retry with the stdlib decoder in that case.
+            return json.loads(s)
+
+    return loads
+
+
+def _json_default(o: Any) -> Any:
+    """
+    Fallback JSON encoder hook for values that the ``json`` module cannot serialize.
+
+    Array-likes such as NumPy arrays and scalars are converted into (lists of)
+    native Python values via their ``tolist()`` method.
+    """
+    if hasattr(o, "tolist"):
+        return o.tolist()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
 
 def yaml_save(record: BenchmarkRecord, fp: IO, options: dict[str, Any]) -> None:
     try:
@@ -41,13 +97,11 @@ def yaml_load(fp: IO, options: dict[str, Any]) -> BenchmarkRecord:
 def json_save(record: BenchmarkRecord, fp: IO[str], options: dict[str, Any]) -> None:
     import json
 
-    json.dump(record.to_json(), fp, **options)
+    json.dump(record.to_json(), fp, **{"default": _json_default, **options})
 
 
 def json_load(fp: IO, options: dict[str, Any]) -> BenchmarkRecord:
-    import json
-
-    benchmarks = json.load(fp, **options)
+    benchmarks = _json_decoder(options)(fp.read())
     return BenchmarkRecord.expand(benchmarks)
 
 
@@ -55,15 +109,18 @@ def ndjson_save(record: BenchmarkRecord, fp: IO, options: dict[str, Any]) -> Non
     # mode is unused, since NDJSON requires every individual benchmark to be one line.
     import json
 
-    bms = record.to_list()
-    fp.write("\n".join([json.dumps(b, **options) for b in bms]))
+    options = {"default": _json_default, **options}
+    # write results one at a time, so that no more than one line is held in memory.
+    for i, b in enumerate(record.iter_results()):
+        if i:
+            fp.write("\n")
+        fp.write(json.dumps(b, **options))
 
 
 def ndjson_load(fp: IO, options: dict[str, Any]) -> BenchmarkRecord:
-    import json
-
     benchmarks: list[dict[str, Any]]
-    benchmarks = [json.loads(line, **options) for line in fp]
+    loads = _json_decoder(options)
+    benchmarks = [loads(line) for line in fp]
     return BenchmarkRecord.expand(benchmarks)
 
 
@@ -75,7 +132,11 @@ def csv_save(record: BenchmarkRecord, fp: IO, options: dict[str, Any]) -> None:
     writer = csv.DictWriter(fp, fieldnames=bm[0].keys(), **options)
     writer.writeheader()
 
+    # the context is the same for every row, so stringify it once
+    # instead of having the CSV writer do it for each row.
+    ctx = str(record.context)
     for b in bm:
+        b["context"] = ctx
         writer.writerow(b)
 
 
@@ -161,9 +222,9 @@ def get_extension(f: str | os.PathLike[str] | IO) -> str:
 
 def get_protocol(url: str | os.PathLike[str]) -> str:
     url = str(url)
-    parts = re.split(r"(::|://)", url, maxsplit=1)
-    if len(parts) > 1:
-        return parts[0]
+    m = _PROTOCOL_SEP.search(url)
+    if m is not None:
+        return url[: m.start()]
     return "file"
 
 
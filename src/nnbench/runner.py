@@ -1,7 +1,6 @@
 """The abstract benchmark runner interface, which can be overridden for custom benchmark workloads."""
 
 import collections
-import contextlib
 import inspect
 import logging
 import os
@@ -9,7 +8,7 @@ import platform
 import sys
 import time
 import uuid
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +17,7 @@ from typing import Any
 from nnbench.context import ContextProvider
 from nnbench.fixtures import FixtureManager
 from nnbench.types import Benchmark, BenchmarkRecord, Parameters, State
+from nnbench.types.benchmark import _EMPTY_PARAMS, NoOp
 from nnbench.types.memo import is_memo, is_memo_type
 from nnbench.util import import_file_as_module, ismodule
 
@@ -30,14 +30,28 @@ def qualname(fn: Callable) -> str:
     return f"{fn.__qualname__}.{fn.__name__}"
 
 
-@contextlib.contextmanager
-def timer(bm: dict[str, Any]) -> Generator[None, None, None]:
-    start = time.perf_counter_ns()
-    try:
-        yield
-    finally:
-        end = time.perf_counter_ns()
-        bm["time_ns"] = end - start
+_perf_counter_ns = time.perf_counter_ns
+
+
+class timer:
+    """
+    Context manager recording the wall time spent in its block as ``bm["time_ns"]``.
+
+    Implemented as a slotted class rather than a generator-based context manager
+    to keep the overhead around very fast benchmarks low.
+    """
+
+    __slots__ = ("bm", "start")
+
+    def __init__(self, bm: dict[str, Any]):
+        self.bm = bm
+        self.start = 0
+
+    def __enter__(self) -> None:
+        self.start = _perf_counter_ns()
+
+    def __exit__(self, *args: Any) -> None:
+        self.bm["time_ns"] = _perf_counter_ns() - self.start
 
 
 def jsonify_params(
@@ -115,7 +129,9 @@ def collect(path_or_module: str | os.PathLike[str], tags: tuple[str, ...] = ())
     benchmarks: list[Benchmark] = []
     ppath = Path(path_or_module)
     if ppath.is_dir():
-        pythonpaths = (p for p in ppath.iterdir() if p.suffix == ".py")
+        # check file names as plain strings, and only construct paths for Python files.
+        with os.scandir(ppath) as it:
+            pythonpaths = [Path(e.path) for e in it if e.name.endswith(".py")]
         for py in pythonpaths:
             logger.debug(f"Collecting benchmarks from submodule {py.name!r}.")
             benchmarks.extend(collect(py, tags))
@@ -130,18 +146,21 @@ def collect(path_or_module: str | os.PathLike[str], tags: tuple[str, ...] = ())
             f"expected a module name, Python file, or directory, " f"got {str(path_or_module)!r}"
         )
 
+    # build the tag set once, instead of once per benchmark.
+    tagset = frozenset(tags)
+
     # iterate through the module dict members to register
     for k, v in module.__dict__.items():
         if k.startswith("__") and k.endswith("__"):
             # dunder names are ignored.
             continue
         elif isinstance(v, Benchmark):
-            if not tags or set(tags) & set(v.tags):
+            if not tagset or not tagset.isdisjoint(v.tags):
                 benchmarks.append(v)
         elif isinstance(v, list | tuple | set | frozenset):
             for bm in v:
                 if isinstance(bm, Benchmark):
-                    if not tags or set(tags) & set(bm.tags):
+                    if not tagset or not tagset.isdisjoint(bm.tags):
                         benchmarks.append(bm)
 
     return benchmarks
@@ -206,10 +225,11 @@ def run(
     for bm in benchmarks:
         family_sizes[bm.interface.funcname] += 1
 
+    dparams: Mapping[str, Any]
     if isinstance(params, Parameters):
         dparams = asdict(params)
     else:
-        dparams = params or {}
+        dparams = params or _EMPTY_PARAMS
 
     results: list[dict[str, Any]] = []
 
@@ -259,14 +279,17 @@ def run(
             "parameters": jsonifier(bmparams),
         }
         try:
-            benchmark.setUp(state, bmparams)
+            # skip calls to the default no-op hooks, which would only add call overhead.
+            if benchmark.setUp is not NoOp:
+                benchmark.setUp(state, bmparams)
             with timer(res):
                 res["value"] = benchmark.fn(**bmparams)
         except Exception as e:
             res["error_occurred"] = True
             res["error_message"] = str(e)
         finally:
-            benchmark.tearDown(state, bmparams)
+            if benchmark.tearDown is not NoOp:
+                benchmark.tearDown(state, bmparams)
             results.append(res)
 
     return BenchmarkRecord(
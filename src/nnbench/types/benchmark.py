@@ -1,9 +1,8 @@
 """Types for benchmarks and records holding results of a run."""
 
-import copy
 import sys
-from collections.abc import Callable, Mapping
-from dataclasses import asdict, dataclass, field
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
 from types import MappingProxyType
 from typing import Any
 
@@ -15,7 +14,7 @@ else:
 from nnbench.types.interface import Interface
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     """
     A dataclass holding some basic information about a benchmark and its hierarchy
@@ -31,12 +30,16 @@ class State:
     family_index: int
 
 
-def NoOp(state: State, params: Mapping[str, Any] = MappingProxyType({})) -> None:
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+"""A shared, immutable empty parameter mapping."""
+
+
+def NoOp(state: State, params: Mapping[str, Any] = _EMPTY_PARAMS) -> None:
     """A no-op setup/teardown callback that does nothing."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BenchmarkRecord:
     """
     A dataclass representing the result of a benchmark run, i.e. the return value
@@ -54,25 +57,53 @@ class BenchmarkRecord:
         """
         Export a benchmark record to JSON.
 
+        The returned dictionary shares its ``context`` and ``benchmarks`` members with
+        the record, so copy them first if you intend to modify the result.
+
         Returns
         -------
         dict[str, Any]
             A JSON representation of the benchmark record.
         """
-        return asdict(self)
+        return {"run": self.run, "context": self.context, "benchmarks": self.benchmarks}
+
+    def iter_results(self) -> Iterator[dict[str, Any]]:
+        """
+        Lazily export a benchmark record as individual results,
+        each with the benchmark run name and context inlined.
+
+        Useful for streaming results one by one, e.g. to a file or database,
+        without materializing all of them in memory first.
+
+        Each result is a shallow copy of the benchmark data, so nested values
+        (including the context) are shared with the record.
+        """
+        for b in self.benchmarks:
+            yield {**b, "context": self.context, "run": self.run}
 
     def to_list(self) -> list[dict[str, Any]]:
         """
         Export a benchmark record to a list of individual results,
         each with the benchmark run name and context inlined.
         """
-        results = []
-        for b in self.benchmarks:
-            bc = copy.deepcopy(b)
-            bc["context"] = self.context
-            bc["run"] = self.run
-            results.append(bc)
-        return results
+        return list(self.iter_results())
+
+    def to_columns(self) -> dict[str, list[Any]]:
+        """
+        Export the benchmarks of a record in a columnar layout.
+
+        Useful for analyses over a single metric (e.g. aggregating the ``time_ns``
+        values of all benchmarks), which then only need to traverse one list.
+
+        Returns
+        -------
+        dict[str, list[Any]]
+            A mapping of each key found in the benchmarks to a list of the values
+            of all benchmarks for that key, in benchmark order. Benchmarks that do not
+            have a key hold ``None`` in its column.
+        """
+        keys = dict.fromkeys(k for b in self.benchmarks for k in b)
+        return {k: [b.get(k) for b in self.benchmarks] for k in keys}
 
     @classmethod
     def expand(cls, bms: dict[str, Any] | list[dict[str, Any]]) -> Self:
@@ -81,6 +112,10 @@ class BenchmarkRecord:
         This is equivalent to extracting the context given by the method it was
         serialized with, and then returning the rest of the data as is.
 
+        When given a list of results, the ``run`` and ``context`` keys are popped
+        from the results in place, and the results become the record's benchmarks.
+        Pass copies if you need to keep the input data intact.
+
         Parameters
         ----------
         bms: dict[str, Any] | list[dict[str, Any]]
@@ -91,30 +126,42 @@ class BenchmarkRecord:
         BenchmarkRecord
             The resulting record, with the context and run name extracted.
         """
-        context: dict[str, Any]
         if isinstance(bms, dict):
-            if "benchmarks" not in bms.keys():
-                raise ValueError(f"no benchmark data found in struct {bms}")
-
-            benchmarks = bms["benchmarks"]
-            context = bms.get("context", {})
-            run = bms.get("run", "")
-        else:
-            run = ""
-            context = {}
-            benchmarks = bms
-            for b in benchmarks:
-                # TODO(nicholasjng): This does not do the right thing if the list contains
-                #  data from multiple benchmark runs, e.g. from a DB query.
-                if "run" in b:
-                    run = b.pop("run")
-                if "context" in b:
-                    # TODO: Log context key/value disagreements
-                    context |= b.pop("context", {})
-        return cls(run=run, benchmarks=benchmarks, context=context)
+            return cls._expand_from_dict(bms)
+        return cls._expand_from_list(bms)
 
+    @classmethod
+    def _expand_from_dict(cls, bms: dict[str, Any]) -> Self:
+        """Expand a record serialized as a single struct, e.g. via ``to_json()``."""
+        if "benchmarks" not in bms:
+            raise ValueError(f"no benchmark data found in struct {bms}")
+
+        benchmarks = bms["benchmarks"]
+        context: dict[str, Any] = bms.get("context", {})
+        run = bms.get("run", "")
+        return cls(run=run, benchmarks=benchmarks, context=context)
 
-@dataclass(frozen=True)
+    @classmethod
+    def _expand_from_list(cls, bms: list[dict[str, Any]]) -> Self:
+        """Expand a record serialized as individual results, e.g. via ``to_list()``."""
+        run = ""
+        context: dict[str, Any] = {}
+        last_ctx = None
+        for b in bms:
+            # TODO(nicholasjng): This does not do the right thing if the list contains
+            #  data from multiple benchmark runs, e.g. from a DB query.
+            run = b.pop("run", run)
+            # TODO: Log context key/value disagreements
+            ctx = b.pop("context", None)
+            # results of the same record usually share their context object
+            # (e.g. coming from ``to_list()``), so it only needs to be merged once.
+            if ctx and ctx is not last_ctx:
+                context |= ctx
+                last_ctx = ctx
+        return cls(run=run, benchmarks=bms, context=context)
+
+
+@dataclass(frozen=True, slots=True)
 class Benchmark:
     """
     Data model representing a benchmark. Subclass this to define your own custom benchmark.
@@ -132,16 +179,36 @@ class Benchmark:
     """A teardown hook run after the benchmark. Must take all members of ``params`` as inputs."""
     tags: tuple[str, ...] = field(repr=False, default=())
     """Additional tags to attach for bookkeeping and selective filtering during runs."""
-    interface: Interface = field(init=False, repr=False)
-    """Benchmark interface, constructed from the given function. Implementation detail."""
+    _interface: Interface | None = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self):
+        # NB: slotted dataclasses are recreated as new classes, which breaks
+        # the zero-argument form of super(), so we set attributes via object.
         if not self.name:
-            super().__setattr__("name", self.fn.__name__)
-        super().__setattr__("interface", Interface.from_callable(self.fn, self.params))
+            object.__setattr__(self, "name", self.fn.__name__)
+        # the generated __init__ of non-slotted dataclass subclasses does not assign
+        # fields with init=False, so initialize the (lazy) interface slot here.
+        object.__setattr__(self, "_interface", None)
+
+    def __hash__(self) -> int:
+        # The generated hash would include ``params``, whose values are often unhashable.
+        # Equal benchmarks have the same function, name and tags, so this is consistent with ``==``.
+        return hash((self.fn, self.name, self.tags))
+
+    @property
+    def interface(self) -> Interface:
+        """
+        Benchmark interface, constructed from the given function. Implementation detail.
+
+        The interface is computed on first access, so that benchmarks which are
+        filtered out before running never need to inspect their function signature.
+        """
+        if self._interface is None:
+            object.__setattr__(self, "_interface", Interface.from_callable(self.fn, self.params))
+        return self._interface
 
 
-@dataclass(init=False, frozen=True)
+@dataclass(init=False, frozen=True, slots=True)
 class Parameters:
     """
     A dataclass designed to hold benchmark parameters.
@@ -151,4 +218,7 @@ class Parameters:
 
     The main advantage over passing parameters as a dictionary are static analysis
     and type safety for your benchmarking code.
+
+    The base class itself is slotted, so subclasses decorated with
+    ``@dataclass(frozen=True, slots=True)`` carry no per-instance ``__dict__``.
     """
@@ -2,8 +2,11 @@
 
 import inspect
 import sys
+import weakref
 from collections.abc import Callable
 from dataclasses import dataclass
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from types import FunctionType
 from typing import Any, TypeVar
 
 if sys.version_info >= (3, 11):
@@ -15,7 +18,58 @@ T = TypeVar("T")
 Variable = tuple[str, type, Any]
 
 
-@dataclass(frozen=True)
+def _weak_memoize(
+    cache: "weakref.WeakKeyDictionary[Callable, T]", fn: Callable, compute: Callable[[Callable], T]
+) -> T:
+    """
+    Returns ``compute(fn)``, memoized in ``cache``.
+
+    The cache is keyed weakly, so that it does not keep ``fn`` alive, and with it any
+    objects it captures (e.g. models in a closure). Callables that are unhashable
+    or cannot be weakly referenced are not cached, and computed on every call.
+    """
+    try:
+        return cache[fn]
+    except KeyError:
+        pass
+    except TypeError:
+        return compute(fn)
+    value = cache[fn] = compute(fn)
+    return value
+
+
+_signature_cache: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _signature_of(fn: Callable) -> inspect.Signature:
+    """
+    Returns the signature of ``fn``, memoized by function, since the same function
+    is usually inspected many times (e.g. once per member of a benchmark family).
+    """
+    return _weak_memoize(_signature_cache, fn, _signature)
+
+
+def _signature(fn: Callable) -> inspect.Signature:
+    # Set `follow_wrapped=False` to get the partially filled interfaces.
+    # Otherwise we get missing value errors for parameters supplied in benchmark decorators.
+    return inspect.signature(fn, follow_wrapped=False)
+
+
+def _is_plain_function(fn: Callable) -> bool:
+    """
+    Checks if ``fn`` is a plain Python function whose signature can be read directly
+    from its code object, i.e. without a custom ``__signature__`` or variadic arguments.
+    """
+    return (
+        isinstance(fn, FunctionType)
+        and getattr(fn, "__signature__", None) is None
+        and not fn.__code__.co_flags & (CO_VARARGS | CO_VARKEYWORDS)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class Interface:
     """
     Data model representing a function's interface.
@@ -29,7 +83,7 @@ class Interface:
     names: tuple[str, ...]
     """Names of the function parameters."""
     types: tuple[type, ...]
-    """Type hints of the function parameters."""
+    """Type hints of the function parameters, as annotated. Annotations are not evaluated, so under ``from __future__ import annotations`` (PEP 563) these are strings."""
     defaults: tuple
     """The function parameters' default values, or inspect.Parameter.empty if a parameter has no default."""
     variables: tuple[Variable, ...]
@@ -46,17 +100,80 @@ class Interface:
         supply a ``defaults`` map and overwrite any default set in the function's
         signature.
         """
-        # Set `follow_wrapped=False` to get the partially filled interfaces.
-        # Otherwise we get missing value errors for parameters supplied in benchmark decorators.
-        sig = inspect.signature(fn, follow_wrapped=False)
-        ret = sig.return_annotation
-        _defaults = {k: defaults.get(k, v.default) for k, v in sig.parameters.items()}
-        # defaults are the signature parameters, then the partial parametrization.
+        fields = _base_interface_fields(fn)
+        # without partial defaults, the interface depends only on the function,
+        # so we can reuse the (immutable) interface fields computed before.
+        if not defaults:
+            return cls(*fields)
+        # otherwise, only the defaults differ, so members of a parametrized family
+        # share the names and types tuples of the function's base interface.
+        funcname, names, types, base_defaults, _, returntype = fields
+        _defaults = tuple(defaults.get(k, d) for k, d in zip(names, base_defaults))
         return cls(
-            fn.__name__,
-            tuple(sig.parameters.keys()),
-            tuple(p.annotation for p in sig.parameters.values()),
-            tuple(_defaults.values()),
-            tuple((k, v.annotation, _defaults[k]) for k, v in sig.parameters.items()),
-            type(ret) if ret is None else ret,
+            funcname, names, types, _defaults, tuple(zip(names, types, _defaults)), returntype
         )
+
+
+_InterfaceFields = tuple[str, tuple[str, ...], tuple[type, ...], tuple, tuple[Variable, ...], type]
+
+
+def _interface_fields(fn: Callable, defaults: dict[str, Any]) -> _InterfaceFields:
+    empty = inspect.Parameter.empty
+    names: list[str] = []
+    types: list[type] = []
+    _defaults: list[Any] = []
+    variables: list[Variable] = []
+
+    if _is_plain_function(fn):
+        # fast path for plain functions: read the parameters directly off the code object,
+        # which gives the same result as ``inspect.signature()`` without building a signature.
+        code = fn.__code__
+        annotations = fn.__annotations__
+        nargs = code.co_argcount
+        posdefaults = fn.__defaults__ or ()
+        kwdefaults = fn.__kwdefaults__ or {}
+        # positional defaults belong to the last positional parameters.
+        offset = nargs - len(posdefaults)
+        for i, k in enumerate(code.co_varnames[: nargs + code.co_kwonlyargcount]):
+            if i < offset:
+                default = empty
+            elif i < nargs:
+                default = posdefaults[i - offset]
+            else:
+                default = kwdefaults.get(k, empty)
+            default = defaults.get(k, default)
+            ann = annotations.get(k, empty)
+            names.append(k)
+            types.append(ann)
+            _defaults.append(default)
+            variables.append((k, ann, default))
+        ret = annotations.get("return", inspect.Signature.empty)
+    else:
+        sig = _signature_of(fn)
+        ret = sig.return_annotation
+        # collect everything in a single pass over the signature parameters.
+        for k, v in sig.parameters.items():
+            # defaults are the signature parameters, then the partial parametrization.
+            default = defaults.get(k, v.default)
+            names.append(k)
+            types.append(v.annotation)
+            _defaults.append(default)
+            variables.append((k, v.annotation, default))
+    return (
+        fn.__name__,
+        tuple(names),
+        tuple(types),
+        tuple(_defaults),
+        tuple(variables),
+        type(ret) if ret is None else ret,
+    )
+
+
+_interface_fields_cache: "weakref.WeakKeyDictionary[Callable, _InterfaceFields]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _base_interface_fields(fn: Callable) -> _InterfaceFields:
+    """Returns the interface fields of ``fn`` without partial defaults, memoized by function."""
+    return _weak_memoize(_interface_fields_cache, fn, lambda f: _interface_fields(f, {}))
@@ -6,25 +6,58 @@ import inspect
 import logging
 import threading
 from collections.abc import Callable
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from types import FunctionType, MethodType
 from typing import Any, Generic, TypeVar, get_args, get_origin
 
 T = TypeVar("T")
 Variable = tuple[str, type, Any]
 
 _memo_cache: dict[int, Any] = {}
+# reverse index of cached values by identity, for constant-time lookups in get_memo_by_value().
+# Maps to a list of memo IDs in insertion order, since multiple memos can hold the same object.
+_value_index: dict[int, list[int]] = {}
 _cache_lock = threading.Lock()
+# per-memo locks for in-flight computations, so each memo value is computed only once.
+_memo_locks: dict[int, threading.Lock] = {}
+# sentinel for cache misses, since ``None`` is a valid memo value.
+_MISSING = object()
 
 logger = logging.getLogger(__name__)
 
 
 def is_memo(v: Any) -> bool:
-    return callable(v) and len(inspect.signature(v).parameters) == 0
+    if not callable(v):
+        return False
+    # fast path for plain functions and methods: count the parameters on the code object.
+    fn, bound = (v.__func__, 1) if isinstance(v, MethodType) else (v, 0)
+    if (
+        isinstance(fn, FunctionType)
+        and getattr(fn, "__wrapped__", None) is None
+        and getattr(fn, "__signature__", None) is None
+    ):
+        code = fn.__code__
+        if not code.co_flags & (CO_VARARGS | CO_VARKEYWORDS):
+            return code.co_argcount + code.co_kwonlyargcount == bound
+    return len(inspect.signature(v).parameters) == 0
 
 
 def is_memo_type(t: type) -> bool:
+    try:
+        return _cached_is_memo_type(t)
+    except TypeError:
+        # unhashable annotations cannot be cached.
+        return _is_memo_type(t)
+
+
+def _is_memo_type(t: type) -> bool:
     return get_origin(t) is collections.abc.Callable and get_args(t)[0] == []
 
 
+# the same few annotations are checked once per benchmark parameter, so memoize the result.
+_cached_is_memo_type = functools.lru_cache(maxsize=1024)(_is_memo_type)
+
+
 def memo_cache_size() -> int:
     """
     Get the current size of the memo cache.
@@ -43,6 +76,7 @@ def clear_memo_cache() -> None:
     """
     with _cache_lock:
         _memo_cache.clear()
+        _value_index.clear()
 
 
 def evict_memo(_id: int) -> Any:
@@ -60,14 +94,23 @@ def evict_memo(_id: int) -> Any:
         The value that was associated with the removed cache entry. If no item is found with the given `_id`, a KeyError is raised.
     """
     with _cache_lock:
-        return _memo_cache.pop(_id)
+        value = _memo_cache.pop(_id)
+        _drop_value_index(_id, value)
+        return value
 
 
 def get_memo_by_value(val: Any) -> int | None:
-    for k, v in _memo_cache.items():
-        if v is val:
-            return k
-    return None
+    ids = _value_index.get(id(val))
+    return ids[0] if ids else None
+
+
+def _drop_value_index(_id: int, value: Any) -> None:
+    # NB: Must be called with the cache lock held.
+    ids = _value_index.get(id(value))
+    if ids is not None and _id in ids:
+        ids.remove(_id)
+        if not ids:
+            del _value_index[id(value)]
 
 
 def cached_memo(fn: Callable) -> Callable:
@@ -88,15 +131,31 @@ def cached_memo(fn: Callable) -> Callable:
     @functools.wraps(fn)
     def wrapper(self, *args, **kwargs):
         _tid = id(self)
+        # single dict reads are atomic, so cache hits can skip the lock.
+        value = _memo_cache.get(_tid, _MISSING)
+        if value is not _MISSING:
+            logger.debug(f"Returning memoized value from cache with ID {_tid}")
+            return value
+        # on a miss, concurrent callers of the same memo wait for a single computation,
+        # while computations of different memos do not block each other.
         with _cache_lock:
-            if _tid in _memo_cache:
+            memo_lock = _memo_locks.setdefault(_tid, threading.Lock())
+        with memo_lock:
+            value = _memo_cache.get(_tid, _MISSING)
+            if value is not _MISSING:
                 logger.debug(f"Returning memoized value from cache with ID {_tid}")
-                return _memo_cache[_tid]
-        logger.debug(f"Computing value on memo with ID {_tid} (cache miss)")
-        value = fn(self, *args, **kwargs)
-        with _cache_lock:
-            _memo_cache[_tid] = value
-        return value
+                return value
+            logger.debug(f"Computing value on memo with ID {_tid} (cache miss)")
+            value = fn(self, *args, **kwargs)
+            with _cache_lock:
+                _memo_cache[_tid] = value
+                _value_index.setdefault(id(value), []).append(_tid)
+                # the lock is only dropped once the value is stored. If the computation
+                # raises, it stays in place, so that waiting and newly arriving callers
+                # still retry one after another instead of concurrently.
+                if _memo_locks.get(_tid) is memo_lock:
+                    del _memo_locks[_tid]
+            return value
 
     return wrapper
 
@@ -116,6 +175,7 @@ class Memo(Generic[T]):
         """Delete the cached object and clear it from the cache."""
         with _cache_lock:
             sid = id(self)
+            _memo_locks.pop(sid, None)
             if sid in _memo_cache:
                 logger.debug(f"Deleting cached value for memo with ID {sid}")
-                del _memo_cache[sid]
+                _drop_value_index(sid, _memo_cache.pop(sid))
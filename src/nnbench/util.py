@@ -1,8 +1,8 @@
 """Various utilities related to benchmark collection, filtering, and more."""
 
+import functools
 import importlib
 import importlib.util
-import itertools
 import os
 import sys
 from importlib.machinery import ModuleSpec
@@ -38,12 +38,19 @@ def flatten(d: dict[str, Any], sep: str = ".", prefix: str = "") -> dict:
     {"a": 1, "b.c": 2}
     """
     d_flat = {}
-    for k, v in d.items():
-        new_key = prefix + sep + k if prefix else k
-        if isinstance(v, dict):
-            d_flat.update(flatten(v, sep=sep, prefix=new_key))
-        else:
+    # walk the nested dictionaries with an explicit stack of item iterators instead
+    # of recursing, which keeps the key order of a depth-first traversal.
+    stack = [(prefix, iter(d.items()))]
+    while stack:
+        pre, items = stack[-1]
+        for k, v in items:
+            new_key = pre + sep + k if pre else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
             d_flat[new_key] = v
+        else:
+            stack.pop()
     return d_flat
 
 
@@ -65,6 +72,12 @@ def unflatten(d: dict[str, Any], sep: str = ".") -> dict[str, Any]:
     Returns
     -------
     dict[str, Any]
+        The unflattened dictionary, with keys in order of their first occurrence.
+
+    Raises
+    ------
+    ValueError
+        If a key is both used as a value and as a prefix of another key, e.g. ``"a"`` and ``"a.b"``.
 
     Examples
     --------
@@ -75,15 +88,24 @@ def unflatten(d: dict[str, Any], sep: str = ".") -> dict[str, Any]:
     >>> unflatten(flatten(d)) == d
     True
     """
-    sorted_keys = sorted(d.keys())
-    unflattened = {}
-    for prefix, keys in itertools.groupby(sorted_keys, key=lambda key: key.split(sep, 1)[0]):
-        key_group = list(keys)
-        if len(key_group) == 1 and sep not in key_group[0]:
-            unflattened[prefix] = d[prefix]
-        else:
-            nested_dict = {key.split(sep, 1)[1]: d[key] for key in key_group}
-            unflattened[prefix] = unflatten(nested_dict, sep=sep)
+    unflattened: dict[str, Any] = {}
+    # IDs of the nested dictionaries created here. Values given by the caller are never
+    # descended into, even if they are dictionaries, so that they are not modified.
+    created = {id(unflattened)}
+    # a single pass over the keys, creating nested dictionaries as needed.
+    for key, value in d.items():
+        *parents, leaf = key.split(sep)
+        cur = unflattened
+        for p in parents:
+            if p not in cur:
+                cur[p] = {}
+                created.add(id(cur[p]))
+            elif id(cur[p]) not in created:
+                raise ValueError(f"key {key!r} conflicts with a non-nested key {p!r}")
+            cur = cur[p]
+        if leaf in cur:
+            raise ValueError(f"key {key!r} conflicts with a nested key")
+        cur[leaf] = value
     return unflattened
 
 
@@ -93,15 +115,11 @@ def ismodule(name: str | os.PathLike[str]) -> bool:
     if name in sys.modules:
         return True
 
-    root, *parts = name.split(".")
-
-    for part in parts:
-        spec = importlib.util.find_spec(root)
-        if spec is None:
-            return False
-        root += f".{part}"
-
-    return importlib.util.find_spec(name) is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # raised for submodules if a parent package does not exist.
+        return False
 
 
 def modulename(file: str | os.PathLike[str]) -> str:
@@ -113,6 +131,11 @@ def modulename(file: str | os.PathLike[str]) -> str:
     >>> modulename("path/to/my/file.py")
     "path.to.my.module"
     """
+    return _modulename(os.fspath(file))
+
+
+@functools.lru_cache(maxsize=1024)
+def _modulename(file: str) -> str:
     fpath = Path(file).with_suffix("")
     if len(fpath.parts) == 1:
         return str(fpath)
@@ -143,13 +166,17 @@ def import_file_as_module(file: str | os.PathLike[str]) -> ModuleType:
     if not fpath.is_file() or fpath.suffix != ".py":
         raise ValueError(f"path {str(file)!r} is not a Python file")
 
-    # TODO: Recomputing this map in a loop can be expensive if many modules are loaded.
-    modmap = {m.__file__: m for m in sys.modules.values() if getattr(m, "__file__", None)}
     spath = str(fpath)
-    if spath in modmap:
+    # search the loaded modules directly instead of building a map of all of them by file.
+    # Later modules take precedence, in case a file was loaded under multiple names.
+    module = next(
+        (m for m in reversed(sys.modules.values()) if getattr(m, "__file__", None) == spath),
+        None,
+    )
+    if module is not None:
         # if the module under "file" has already been loaded, return it,
         # otherwise we get nasty type errors in collection.
-        return modmap[spath]
+        return module
 
     modname = modulename(fpath)
     if modname in sys.modules:
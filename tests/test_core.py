@@ -65,3 +65,12 @@ def test_product_with_duplicate_parameters():
         @product(iter=[1, 1])
         def product_benchmark(iter: int) -> int:
             return iter
+
+
+def test_parametrized_benchmarks_are_hashable():
+    @parametrize([{"a": [1, 2]}, {"a": [3, 4]}])
+    def parametrized_benchmark(a: list[int]) -> int:
+        return sum(a)
+
+    assert len(set(parametrized_benchmark)) == 2
+    assert len({*parametrized_benchmark, *parametrized_benchmark}) == 2
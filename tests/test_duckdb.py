@@ -0,0 +1,117 @@
+import gc
+import tempfile
+import warnings
+from pathlib import Path
+
+import pytest
+
+import nnbench.reporter.duckdb_sql as duckdb_sql
+from nnbench.reporter.duckdb_sql import DuckDBReporter
+
+
+class StubConnection:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StubDuckDB:
+    """Stands in for the ``duckdb`` module, since these tests only cover the reporter lifecycle."""
+
+    @staticmethod
+    def connect(dbname: str, read_only: bool = False) -> StubConnection:
+        return StubConnection()
+
+
+@pytest.fixture(autouse=True)
+def stub_duckdb(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(duckdb_sql, "DUCKDB_INSTALLED", True)
+    monkeypatch.setattr(duckdb_sql, "duckdb", StubDuckDB, raising=False)
+    # create temporary directories in a known location.
+    tempdir = tmp_path / "tmp"
+    tempdir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(tempdir))
+    return tempdir
+
+
+def test_duckdb_no_directory_unless_accessed(stub_duckdb: Path) -> None:
+    r = DuckDBReporter()
+    r.initialize()
+    assert list(stub_duckdb.iterdir()) == []
+    r.finalize()
+
+    r = DuckDBReporter()
+    d = Path(r.directory)
+    assert d.parent == stub_duckdb
+    assert d.is_dir()
+    assert r.directory == d
+    r.finalize()
+
+
+def test_duckdb_finalize_removes_temporary_directory() -> None:
+    r = DuckDBReporter()
+    r.initialize()
+    conn = r.conn
+    d = Path(r.directory)
+    r.finalize()
+    assert conn.closed
+    assert r.conn is None
+    assert not d.exists()
+
+
+def test_duckdb_context_manager() -> None:
+    with DuckDBReporter() as r:
+        conn = r.conn
+        d = Path(r.directory)
+        assert d.is_dir()
+    assert conn.closed
+    assert not d.exists()
+
+
+def test_duckdb_temporary_directory_removed_on_gc() -> None:
+    r = DuckDBReporter()
+    d = Path(r.directory)
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+        del r
+        gc.collect()
+    assert not d.exists()
+    assert not [x for x in w if issubclass(x.category, ResourceWarning)]
+
+
+def test_duckdb_reuse_after_finalize() -> None:
+    r = DuckDBReporter()
+    with r:
+        d1 = Path(r.directory)
+    assert not d1.exists()
+
+    with r:
+        assert r.conn is not None and not r.conn.closed
+        d2 = Path(r.directory)
+        assert d2.is_dir()
+    assert not d2.exists()
+
+
+@pytest.mark.parametrize("delete", [True, False])
+def test_duckdb_user_directory_finalizer(tmp_path: Path, delete: bool) -> None:
+    d = tmp_path / "records"
+    d.mkdir()
+    r = DuckDBReporter(directory=d, delete=delete)
+    assert r.directory == d
+    del r
+    gc.collect()
+    assert d.exists() != delete
+
+
+def test_duckdb_user_directory_removed_on_finalize(tmp_path: Path) -> None:
+    d = tmp_path / "records"
+    d.mkdir()
+    r = DuckDBReporter(directory=d, delete=True)
+    r.finalize()
+    assert not d.exists()
+    # a reused reporter recreates the directory instead of writing into a deleted one.
+    assert Path(r.directory).is_dir()
+    r.finalize()
+    assert not d.exists()
@@ -1,8 +1,10 @@
+import array
 from pathlib import Path
 
 import pytest
 
-from nnbench.reporter.file import FileReporter
+import nnbench.reporter.file as file_module
+from nnbench.reporter.file import FileReporter, get_protocol
 from nnbench.types import BenchmarkRecord
 
 
@@ -31,3 +33,92 @@ def test_fileio_writes_no_compression_inline(tmp_path: Path, ext: str) -> None:
             assert set(map(str, bm1.values())) == set(bm2.values())
     else:
         assert rec2 == rec
+
+
+@pytest.mark.parametrize("ext", ["json", "ndjson"])
+def test_fileio_json_nonfinite_values(tmp_path: Path, ext: str) -> None:
+    """Tests that non-finite floats survive a roundtrip through the JSON drivers."""
+    f = FileReporter()
+
+    rec = BenchmarkRecord(
+        run="my-run",
+        context={"a": "b"},
+        benchmarks=[{"name": "foo", "value": float("inf")}],
+    )
+    file = tmp_path / f"record.{ext}"
+    f.write(rec, file)
+    rec2 = f.read(file)
+    assert rec2 == rec
+
+
+@pytest.mark.parametrize("ext", ["json", "ndjson"])
+def test_fileio_json_without_orjson(
+    tmp_path: Path, ext: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tests that the JSON drivers fall back to the standard library without orjson."""
+    monkeypatch.setattr(file_module, "ORJSON_INSTALLED", False)
+    monkeypatch.setattr(file_module, "orjson", None, raising=False)
+    f = FileReporter()
+
+    rec = BenchmarkRecord(
+        run="my-run",
+        context={"a": "b"},
+        benchmarks=[{"name": "foo", "value": 1}, {"name": "bar", "value": float("nan")}],
+    )
+    file = tmp_path / f"record.{ext}"
+    f.write(rec, file)
+    rec2 = f.read(file)
+    assert rec2.run == rec.run
+    assert rec2.context == rec.context
+    assert [b["name"] for b in rec2.benchmarks] == ["foo", "bar"]
+    assert rec2.benchmarks[0]["value"] == 1
+
+
+@pytest.mark.parametrize("ext", ["json", "ndjson"])
+def test_fileio_json_big_integers(tmp_path: Path, ext: str) -> None:
+    """Tests that integers outside the 64-bit range survive a roundtrip exactly."""
+    f = FileReporter()
+
+    rec = BenchmarkRecord(
+        run="my-run",
+        context={"a": "b"},
+        benchmarks=[
+            {"name": "foo", "value": 2**64},
+            {"name": "bar", "value": -(10**30)},
+            {"name": "baz", "value": 2**63 - 1},
+        ],
+    )
+    file = tmp_path / f"record.{ext}"
+    f.write(rec, file)
+    rec2 = f.read(file)
+    assert [b["value"] for b in rec2.benchmarks] == [2**64, -(10**30), 2**63 - 1]
+    assert all(isinstance(b["value"], int) for b in rec2.benchmarks)
+
+
+@pytest.mark.parametrize("ext", ["json", "ndjson"])
+def test_fileio_json_array_values(tmp_path: Path, ext: str) -> None:
+    """Tests that array-like values are serialized as lists by the JSON drivers."""
+    f = FileReporter()
+
+    rec = BenchmarkRecord(
+        run="my-run",
+        context={"a": "b"},
+        benchmarks=[{"name": "foo", "value": array.array("i", [1, 2, 3])}],
+    )
+    file = tmp_path / f"record.{ext}"
+    f.write(rec, file)
+    rec2 = f.read(file)
+    assert rec2.benchmarks[0]["value"] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "url,protocol",
+    [
+        ("record.json", "file"),
+        ("/tmp/record.json", "file"),
+        ("s3://bucket/record.json", "s3"),
+        ("simplecache::s3://bucket/record.json", "simplecache"),
+    ],
+)
+def test_get_protocol(url: str, protocol: str) -> None:
+    assert get_protocol(url) == protocol
@@ -1,9 +1,11 @@
+import time
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from nnbench.types import Memo, cached_memo
-from nnbench.types.memo import clear_memo_cache, memo_cache_size
+from nnbench.types.memo import clear_memo_cache, evict_memo, get_memo_by_value, memo_cache_size
 
 
 @pytest.fixture
@@ -27,3 +29,80 @@ def test_memo_caching(clear_memos):
     m()
     assert memo_cache_size() == 1
     m()
+
+
+class NoneMemo(Memo[None]):
+    calls = 0
+
+    @cached_memo
+    def __call__(self):
+        NoneMemo.calls += 1
+        return None
+
+
+def test_memo_caches_none(clear_memos):
+    m = NoneMemo()
+    assert m() is None
+    assert m() is None
+    assert NoneMemo.calls == 1
+
+
+def test_get_memo_by_value(clear_memos):
+    m1, m2 = MyMemo(), MyMemo()
+    v = m1()
+    m2()
+    assert get_memo_by_value(v) == id(m1)
+    evict_memo(id(m1))
+    assert get_memo_by_value(v) == id(m2)
+    evict_memo(id(m2))
+    assert get_memo_by_value(v) is None
+
+
+class SlowMemo(Memo[int]):
+    calls = 0
+
+    @cached_memo
+    def __call__(self):
+        SlowMemo.calls += 1
+        time.sleep(0.05)
+        return 0
+
+
+def test_memo_computed_once_across_threads(clear_memos):
+    m = SlowMemo()
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda _: m(), range(4)))
+    assert results == [0, 0, 0, 0]
+    assert SlowMemo.calls == 1
+
+
+class FlakyMemo(Memo[int]):
+    calls = 0
+
+    @cached_memo
+    def __call__(self):
+        FlakyMemo.calls += 1
+        time.sleep(0.1)
+        if FlakyMemo.calls == 1:
+            raise RuntimeError("first computation fails")
+        return 0
+
+
+def test_memo_computed_once_after_failure(clear_memos):
+    m = FlakyMemo()
+
+    def call(delay):
+        time.sleep(delay)
+        try:
+            return m()
+        except RuntimeError as e:
+            return e
+
+    # two callers start right away, the other two arrive while the failed
+    # computation is being retried.
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(call, [0, 0, 0.15, 0.15]))
+    assert sum(isinstance(r, RuntimeError) for r in results) == 1
+    assert results.count(0) == 3
+    # one failed computation, and exactly one retry.
+    assert FlakyMemo.calls == 2
@@ -1,6 +1,10 @@
+import gc
 import inspect
+import weakref
+from dataclasses import dataclass
 
-from nnbench.types.interface import Interface
+from nnbench.types import Benchmark, BenchmarkRecord
+from nnbench.types.interface import Interface, _signature_of
 
 
 def test_interface_with_no_arguments():
@@ -31,3 +35,139 @@ def test_interface_with_multiple_arguments():
         ("d", float, 10.0),
     )
     assert interface.returntype is type(None)
+
+
+def test_record_iter_results():
+    rec = BenchmarkRecord(
+        run="my-run",
+        context={"a": "b"},
+        benchmarks=[{"name": "foo", "value": 1}, {"name": "bar", "value": 2}],
+    )
+    results = rec.iter_results()
+    assert next(results) == {"name": "foo", "value": 1, "context": {"a": "b"}, "run": "my-run"}
+    assert list(results) == rec.to_list()[1:]
+
+
+def test_interface_with_partial_defaults():
+    def fn(a: int, b: str = "hello") -> None:
+        pass
+
+    i1 = Interface.from_callable(fn, {})
+    i2 = Interface.from_callable(fn, {"a": 1})
+    assert i1.defaults == (inspect.Parameter.empty, "hello")
+    assert i2.defaults == (1, "hello")
+    assert i2.variables == (("a", int, 1), ("b", str, "hello"))
+
+
+def test_record_to_columns():
+    rec = BenchmarkRecord(
+        run="my-run",
+        context={"a": "b"},
+        benchmarks=[{"name": "foo", "value": 1}, {"name": "bar", "time_ns": 2}],
+    )
+    assert rec.to_columns() == {
+        "name": ["foo", "bar"],
+        "value": [1, None],
+        "time_ns": [None, 2],
+    }
+
+
+def test_interface_without_defaults_is_reused():
+    def fn(a: int, b: str = "hello") -> None:
+        pass
+
+    i1 = Interface.from_callable(fn, {})
+    i2 = Interface.from_callable(fn, {})
+    assert i1 == i2
+    assert i1.variables is i2.variables
+
+
+def test_interface_matches_signature():
+    def fn(a, b: int, /, c: float = 1.0, *, d: str, e: bool = False) -> int:
+        x = a + b
+        return x
+
+    i = Interface.from_callable(fn, {"d": "x"})
+    params = inspect.signature(fn).parameters
+    assert i.names == tuple(params)
+    assert i.types == tuple(p.annotation for p in params.values())
+    assert i.defaults == (inspect.Parameter.empty, inspect.Parameter.empty, 1.0, "x", False)
+    assert i.returntype is int
+
+
+def test_interface_keeps_string_annotations():
+    def fn(a: "int", b: "list[str]") -> "None":
+        pass
+
+    i = Interface.from_callable(fn, {})
+    assert i.types == ("int", "list[str]")
+    assert i.returntype == "None"
+
+
+def test_interfaces_with_partial_defaults_share_fields():
+    def fn(a: int, b: str = "hello") -> None:
+        pass
+
+    i1 = Interface.from_callable(fn, {"a": 1})
+    i2 = Interface.from_callable(fn, {"a": 2, "b": "world"})
+    assert i1.names is i2.names
+    assert i1.types is i2.types
+    assert i2.defaults == (2, "world")
+    assert i2.variables == (("a", int, 2), ("b", str, "world"))
+
+
+def _closure_over(obj, varargs: bool):
+    if varargs:
+
+        def fn(*args):
+            return obj
+
+    else:
+
+        def fn():
+            return obj
+
+    return fn
+
+
+def test_signature_cache_does_not_keep_captured_objects_alive():
+    class Model:
+        pass
+
+    model = Model()
+    ref = weakref.ref(model)
+    fn = _closure_over(model, varargs=True)
+    del model
+    _signature_of(fn)
+    del fn
+    gc.collect()
+    assert ref() is None
+
+
+def test_interface_cache_does_not_keep_captured_objects_alive():
+    class Model:
+        pass
+
+    model = Model()
+    ref = weakref.ref(model)
+    fn = _closure_over(model, varargs=False)
+    del model
+    Interface.from_callable(fn, {})
+    Benchmark(fn).interface
+    del fn
+    gc.collect()
+    assert ref() is None
+
+
+def test_benchmark_dataclass_subclass():
+    @dataclass(frozen=True)
+    class MyBenchmark(Benchmark):
+        extra: int = 0
+
+    def fn(a: int) -> int:
+        return a
+
+    bm = MyBenchmark(fn, extra=1)
+    assert bm.name == "fn"
+    assert bm.extra == 1
+    assert bm.interface.names == ("a",)
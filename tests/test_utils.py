@@ -1,11 +1,16 @@
+import importlib
 import inspect
+import sys
+from pathlib import Path
 
 import pytest
 
-from nnbench.util import ismodule, modulename
+from nnbench.util import flatten, import_file_as_module, ismodule, modulename, unflatten
 
 
-@pytest.mark.parametrize("name,expected", [("sys", True), ("yaml", True), ("pipapo", False)])
+@pytest.mark.parametrize(
+    "name,expected", [("sys", True), ("yaml", True), ("pipapo", False), ("pipapo.sub", False)]
+)
 def test_ismodule(name: str, expected: bool) -> None:
     actual = ismodule(name)
     assert expected == actual
@@ -20,6 +25,57 @@ def test_modulename(name: str, expected: str) -> None:
     assert expected == actual
 
 
+def test_flatten() -> None:
+    d = {"a": 1, "b": {"c": 2, "d": {"e": 3}}, "f": 4}
+    flat = flatten(d)
+    assert flat == {"a": 1, "b.c": 2, "b.d.e": 3, "f": 4}
+    assert list(flat) == ["a", "b.c", "b.d.e", "f"]
+    assert flatten(d, sep="_", prefix="x") == {"x_a": 1, "x_b_c": 2, "x_b_d_e": 3, "x_f": 4}
+
+
+def test_unflatten() -> None:
+    d = {"z": 1, "b": {"c": 2, "d": {"e": 3}}, "a": 4}
+    assert unflatten(flatten(d)) == d
+    assert list(unflatten(flatten(d))) == ["z", "b", "a"]
+
+    with pytest.raises(ValueError):
+        unflatten({"a": 1, "a.b": 2})
+    with pytest.raises(ValueError):
+        unflatten({"a.b": 2, "a": 1})
+
+    # dictionary values are not merged into, and are left unchanged.
+    inner = {"x": 1}
+    with pytest.raises(ValueError):
+        unflatten({"a": inner, "a.b": 2})
+    assert inner == {"x": 1}
+
+
+def test_import_file_as_module_after_module_removal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    bm, other = tmp_path / "bm.py", tmp_path / "other.py"
+    bm.write_text("X = 1\n")
+    other.write_text("Y = 1\n")
+    (tmp_path / "nnbench_test_third.py").write_text("Z = 1\n")
+    names = [modulename(bm), modulename(other), "nnbench_test_third"]
+    try:
+        module = import_file_as_module(bm)
+        import_file_as_module(other)
+        assert import_file_as_module(bm) is module
+
+        # replace the module, keeping the number of loaded modules the same.
+        bm.write_text("X = 22\n")
+        del sys.modules[module.__name__]
+        importlib.import_module("nnbench_test_third")
+
+        assert import_file_as_module(bm).X == 22
+    finally:
+        for name in names:
+            sys.modules.pop(name, None)
+
+
 def has_expected_args(fn, expected_args):
     signature = inspect.signature(fn)
     params = signature.parameters